@@ -25,7 +25,7 @@ modules.
 
 ## Requirements
 
-- (Python 3) argparse, numpy, re, sys  
+- (Python 3) argparse, re, string, sys  
 
 
 ## Examples
@@ -102,11 +102,12 @@ import sys
 version_string = ".".join(map(str, sys.version_info[:3]))
 
 try:
-    import numpy as np
     import re
+    import string
     import argparse
-    from typing import Union, Tuple
+    from typing import List, NamedTuple, Optional, TextIO, Union, Tuple
     from enum import Enum
+    from functools import lru_cache
 
 except ModuleNotFoundError:
     sys.exit(f"\n*****\npython {version_string}: {sys.exc_info()[1]}\n*****\n")
@@ -126,7 +127,7 @@ also handled. It also works as a script directly called from the command line.
   field separators for input provisional designations are " ", "_", "-" or none,
   i.e. 2008EV5 is also a valid input string.
 
-* Requirements (Python 3): numpy, re, sys and argparse modules
+* Requirements (Python 3): re, string, sys and argparse modules
     """,
     epilog='May 2020. Victor Ali Lagoa (vmalilagoa@gmail.com)'
 )
@@ -168,9 +169,39 @@ encode_year = {
     '20': 'K',
 }
 
+# Packed version of every year of the centuries above, e.g. "1923" -> "J23"
+encode_full_year = {
+    century + f"{year:02d}": packed_century + f"{year:02d}"
+    for century, packed_century in encode_year.items()
+    for year in range(100)
+}
+
+# The 62 "digits" of the base 62 notation of number designations > 619999,
+# e.g. ~0000 (620000) or ~000z (620061)
+base_62_digits = string.digits + string.ascii_uppercase + string.ascii_lowercase
+# and their values, e.g. "0" -> 0, "A" -> 10, "z" -> 61
+base_62_values = {digit: value for value, digit in enumerate(base_62_digits)}
+# Two-digit values of the letters, e.g. "A" -> "10", "z" -> "61"
+letter_values = {digit: str(value) for value, digit in enumerate(base_62_digits)
+                 if value > 9}
+
+# Unpacked version of the two characters in the middle of a packed provisional
+# designation (the cycle count), e.g. "05" -> "5", "A0" -> "100", "00" -> ""
+unpack_cycle_count = {
+    tens_character + str(units): str(10 * tens + units) if tens or units else ""
+    for tens, tens_character in enumerate(base_62_digits)
+    for units in range(10)
+}
+# and the other way round, e.g. "5" -> "05", "100" -> "A0", "" -> "00"
+pack_cycle_count = {count: packed for packed, count in unpack_cycle_count.items()}
+
 ################################################################################
 # Compiled regular expressions
 #
+# The patterns that use \b are compiled without re.ASCII: with it, non-ASCII
+# letters and digits would count as word boundaries, so e.g. "K08E05Vé" would
+# be taken as K08E05V followed by some text.
+#
 re_number_designation = re.compile(r"^[(]?(\d{1,8})[)]?\b")
 
 re_packed_number_designation = re.compile(r"\b([~a-zA-Z])(\d{4})\b")
@@ -180,6 +211,11 @@ re_packed_number_designation = re.compile(r"\b([~a-zA-Z])(\d{4})\b")
 # Capture the first group of numbers before the last four:
 re_provisional_designation = \
     re.compile(r"\b(\d{4})([- _]?)([a-zA-Z]{2})(\d*)\b")
+# Same, but anchored at both ends, for inputs that are only one designation.
+# This one and re_any_designation are compiled with re.ASCII (\d only matches
+# 0-9), so that the fast paths that use them only see ASCII designations:
+re_single_provisional_designation = \
+    re.compile(r"\A(\d{4})([- _]?)([a-zA-Z]{2})(\d*)\Z", re.ASCII)
 re_packed_provisional_designation = \
     re.compile(r"\b([IJK])(\d{2})([A-Z])([a-zA-Z0-9])(\d)([A-Z])\b")
 re_survey = re.compile(r"\b(\d{4})[- _]([PT])-([L123])\b")
@@ -187,6 +223,30 @@ re_packed_survey = re.compile(r"\b([PT])([L123])S(\d{4})\b")
 re6digits = re.compile(r"\b(\d{2,})(\d{4})\b")
 re_packed_long = re.compile(r"(~)([0-9a-zA-Z]{4})\b")
 
+# All the formats above in a single alternation. The name of the matched group
+# tells which kind of designation a (stripped) input is, so that we do not have
+# to try the regular expressions above one after the other. See classify().
+re_any_designation = re.compile(
+    r"(?P<survey>\d{4}[- _][PT]-[L123])"
+    r"|(?P<packed_survey>[PT][L123]S\d{4})"
+    r"|(?P<packed_long>~[0-9a-zA-Z]{4})"
+    r"|(?P<packed_number>[~a-zA-Z]\d{4})"
+    r"|(?P<provisional>\d{4}[- _]?[a-zA-Z]{2}\d*)"
+    r"|(?P<packed_provisional>[IJK]\d{2}[A-Z][a-zA-Z0-9]\d[A-Z])"
+    r"|(?P<number>[(]?\d{1,8}[)]?)",
+    re.ASCII
+)
+
+# Kinds of designation returned by classify(), grouped by the function that
+# packs or unpacks them
+survey_kinds = ("survey", "packed_survey")
+number_kinds = ("number", "packed_number", "packed_long")
+provisional_kinds = ("provisional", "packed_provisional")
+
+# Translation table for str.translate(), faster than re.sub() for simply
+# removing the parentheses of e.g. "(1) Ceres"
+delete_parentheses = str.maketrans("", "", "()")
+
 
 ###############################################################################
 #
@@ -197,6 +257,18 @@ class Mode(Enum):
     UNPACK = "unpack"
 
 
+###############################################################################
+#
+# Results of the validators for one designation, so that classify() runs each
+# of them only once
+#
+class Probe(NamedTuple):
+    survey: bool
+    number: bool
+    provisional: bool
+    single_unpacked_provisional: bool
+
+
 ###############################################################################
 # Functions
 #
@@ -210,12 +282,10 @@ def decode_letter(character: str) -> str:
 
     *Return: str
     """
-    if len(character) != 1 or character < 'A' or character > 'z':
+    value = letter_values.get(character)
+    if value is None:
         return f"decode_letter() error: invalid character {character}"
-    elif character <= 'Z':
-        return str(ord(character) - 55)
-    elif character <= 'z':
-        return str(ord(character) - 61)
+    return value
 
 
 def encode_cyphers(cyphers: Union[str, int]) -> str:
@@ -232,15 +302,14 @@ def encode_cyphers(cyphers: Union[str, int]) -> str:
     except ValueError:
         return f"encode_cyphers() error: {cyphers} cannot be encoded to a character"
 
-    if number < 36:
-        return chr(number + 55)
-    else:
-        return chr(number + 61)
+    return base_62_digits[number]
 
 
-def get_packing_dictionaries() -> Tuple[dict, dict]:
-    """Returns two dictionaries, one to decode a letter into two digits,
-    one to encode two digits into letters
+@lru_cache(maxsize=None)
+def build_packing_dictionaries() -> Tuple[dict, dict]:
+    """Builds the two dictionaries returned by get_packing_dictionaries(),
+    one to decode a letter into two digits, one to encode two digits into
+    letters. They are only built on the first call and then cached.
 
     *Return: dictionary, dictionary
     """
@@ -268,7 +337,19 @@ def get_packing_dictionaries() -> Tuple[dict, dict]:
     return decode, encode
 
 
-def to_stripped_string(designation: str):
+def get_packing_dictionaries() -> Tuple[dict, dict]:
+    """Returns two dictionaries, one to decode a letter into two digits,
+    one to encode two digits into letters. They are copies of the cached ones
+    of build_packing_dictionaries(), so the caller can modify them.
+
+    *Return: dictionary, dictionary
+    """
+
+    decode, encode = build_packing_dictionaries()
+    return dict(decode), dict(encode)
+
+
+def to_stripped_string(designation: str) -> str:
     """
     Cast to string if possible and remove the leading and trailing space
     characters from the input string
@@ -278,6 +359,26 @@ def to_stripped_string(designation: str):
     return str(designation).strip()
 
 
+def replace_first_separator(designation: str) -> str:
+    """
+    Replace the first " " or "_" of the input string with "-", e.g.
+    "2008 EV5" -> "2008-EV5". This is what re.sub("[ _]", "-", designation,
+    count=1) does, only without going through the regular expression engine.
+
+    *Return: string
+    """
+    space = designation.find(" ")
+    underscore = designation.find("_")
+    if underscore < 0 or 0 <= space < underscore:
+        position = space
+    else:
+        position = underscore
+
+    if position < 0:
+        return designation
+    return designation[:position] + "-" + designation[position + 1:]
+
+
 def is_valid_survey_designation(designation: str) -> bool:
     """
     Check whether the input designation is a valid survey designation (packed 
@@ -290,25 +391,26 @@ def is_valid_survey_designation(designation: str) -> bool:
     *Return: boolean
     """
 
-    try:
-        designation = str(designation).strip()
-        return is_packed_or_unpacked(designation, re_survey, re_packed_survey)
-    except AttributeError:
-        return False
+    designation = str(designation).strip()
+    if matches_exactly(designation, re_survey) or \
+            matches_exactly(designation, re_packed_survey):
+        return True
+    return matches_once(designation, re_survey) or \
+        matches_once(designation, re_packed_survey)
 
 
 def is_unpacked_survey_designation(designation: str) -> bool:
     try:
         designation = designation.strip()
-        return designation_matches_compiled_re(designation, re_survey)
+        return matches_once(designation, re_survey)
     except AttributeError:
         return False
 
 
 def is_packed_survey_designation(designation: str) -> bool:
     try:
-        designation: str = designation.strip()
-        return designation_matches_compiled_re(designation, re_packed_survey)
+        designation = designation.strip()
+        return matches_once(designation, re_packed_survey)
     except AttributeError:
         return False
 
@@ -337,25 +439,23 @@ def is_valid_number_designation(designation: Union[str, int]) -> bool:
     *Return: boolean
     """
 
-    try:
-        designation = str(designation).strip()
-    except AttributeError:
-        # Is it an array or a list?
-        return False
+    designation = str(designation).strip()
 
     # can we transform it into a single string with digits?
-    if designation.isdigit():
-        if designation_matches_compiled_re(designation, re_number_designation):
-            return True
-        else:
-            # It should not be longer than 8 digit characters long (in 2020!)
-            return False
-    elif designation_matches_compiled_re(designation, re_packed_long):
+    # (isdigit() also accepts non-ASCII digits, e.g. "²", which are left to
+    # the regular expressions below)
+    if designation.isdigit() and designation.isascii():
+        # No need for re_number_designation: it should not be longer than 8
+        # digit characters long (in 2020!)
+        return len(designation) <= 8
+    elif matches_once(designation, re_packed_long):
         return True
-    elif designation_matches_compiled_re(designation, re_packed_number_designation):
+    elif matches_once(designation, re_packed_number_designation):
         return True
-    elif designation_matches_compiled_re(designation, re_number_designation):
+    elif re_number_designation.match(designation):
         # => must still be of the type "(1) Ceres"
+        # (re_number_designation is anchored with ^, so it cannot match more
+        # than once: match() is enough)
         return True
     else:
         return False
@@ -374,31 +474,87 @@ def is_valid_provisional_designation(designation: str) -> bool:
     *Return: boolean
     """
 
-    try:
-        designation: str = str(designation).strip()
-        return is_packed_or_unpacked(designation,
-                                     re_provisional_designation,
-                                     re_packed_provisional_designation)
-    except AttributeError:
-        return False
+    designation = str(designation).strip()
+    if matches_exactly(designation, re_provisional_designation) or \
+            matches_exactly(designation, re_packed_provisional_designation):
+        return True
+    return matches_once(designation, re_provisional_designation) or \
+        matches_once(designation, re_packed_provisional_designation)
 
 
-def is_an_asteroid_designation(designation):
+def is_an_asteroid_designation(designation: Union[str, int]) -> bool:
     """
-    This function checks whether the input is a valid asteroid designation. It 
-    simply encapsulates calls to is_valid_provisional_designation(), 
-    is_valid_survey_designation() and is_valid_number_designation().
+    This function checks whether the input is a valid asteroid designation,
+    i.e. whether classify() finds its kind.
 
     *Input: an asteroid designation (string or integer)
 
     *Return: boolean
     """
 
-    return is_valid_provisional_designation(designation) or is_valid_survey_designation(
-        designation) or is_valid_number_designation(designation)
+    return classify(designation) is not None
 
 
-def designation_matches_compiled_re(designation: str, compiled_re: re) -> bool:
+def classify(designation: Union[str, int]) -> Optional[str]:
+    """
+    Return the kind of the input asteroid designation, i.e. the name of the
+    matching group of re_any_designation: "survey", "packed_survey", "number",
+    "packed_number", "packed_long", "provisional" or "packed_provisional". It
+    returns None if the input is not a valid designation.
+
+    If the input is exactly one designation, which is the usual case, a single
+    fullmatch() decides. Otherwise, e.g. "(1) Ceres" or "(341843) 2008 EV5", we
+    fall back on the validators in the order used by pack() and unpack().
+
+    The result for each (stripped) input is cached, see classify_string().
+
+    *Input: an asteroid designation (string or integer)
+
+    *Return: string or None
+    """
+
+    return classify_string(str(designation).strip())
+
+
+@lru_cache(maxsize=65536)
+def classify_string(designation: str) -> Optional[str]:
+    """
+    Does the work of classify() for an already stripped string. The results
+    are kept in a bounded cache (the last 65536 inputs), so designations that
+    appear several times in a list, e.g. a merged catalogue, or that are
+    classified again by pack() or unpack(), are only classified once.
+
+    *Input: an asteroid designation (stripped string)
+
+    *Return: string or None
+    """
+
+    found = re_any_designation.fullmatch(designation)
+    if found:
+        return found.lastgroup
+
+    flags = probe(designation)
+
+    if flags.survey:
+        # the input is already stripped, so we skip is_unpacked_survey_designation()
+        if matches_once(designation, re_survey):
+            return "survey"
+        return "packed_survey"
+    elif flags.number and not flags.single_unpacked_provisional:
+        if matches_once(designation, re_packed_long):
+            return "packed_long"
+        elif matches_once(designation, re_packed_number_designation):
+            return "packed_number"
+        return "number"
+    elif flags.provisional:
+        if matches_once(designation, re_provisional_designation):
+            return "provisional"
+        return "packed_provisional"
+    else:
+        return None
+
+
+def designation_matches_compiled_re(designation: str, compiled_re: re.Pattern) -> bool:
     """
     Check whether the input asteroid designation is matched by the input 
     compiled regular expressions.
@@ -409,27 +565,76 @@ def designation_matches_compiled_re(designation: str, compiled_re: re) -> bool:
     *Return: boolean
     """
 
-    it_matches = False  # by default
+    return matches_once(str(designation).strip(), compiled_re)
 
-    designation = str(designation).strip()
 
-    found = compiled_re.findall(designation)
-    if found and len(found) == 1:
-        # We consider more than one match suspicious (the input
-        # should contain only one valid asteroid designation).
-        it_matches = True
+def matches_once(designation: str, compiled_re: re.Pattern) -> bool:
+    """
+    Does the work of designation_matches_compiled_re() for an input that is
+    already a stripped string, so that the validators do not strip it again.
+
+    *Input: an asteroid designation (stripped string)
+    *Input: a compiled regular expression
+
+    *Return: boolean
+    """
+
+    return search_once(designation, compiled_re) is not None
+
+
+def search_once(designation: str, compiled_re: re.Pattern) -> Optional[re.Match]:
+    """
+    Return the match of the input compiled regular expression in the input
+    string if there is exactly one match, or None otherwise (no match or more
+    than one match).
+
+    *Input: a string
+    *Input: a compiled regular expression
+
+    *Return: match object or None
+    """
+
+    found = compiled_re.search(designation)
+    if found is None:
+        return None
+
+    # We consider more than one match suspicious (the input should contain
+    # only one valid asteroid designation), so we look for a second match
+    # after the first one. Unlike findall(), this does not build a list.
+    if compiled_re.search(designation, found.end()) is not None:
+        return None
+
+    return found
+
+
+def matches_exactly(designation: str, compiled_re: re.Pattern) -> bool:
+    """
+    Check whether the whole input string is matched by the input compiled
+    regular expression. This is a shortcut for designation_matches_compiled_re()
+    when the input is just one designation: the input is not stripped again and
+    we do not look for a second match. Use it only with regular expressions
+    whose full match cannot contain a second match, e.g. those of the survey
+    and provisional designations.
+
+    *Input: an asteroid designation (stripped string)
+    *Input: a compiled regular expression
+
+    *Return: boolean
+    """
 
-    return it_matches
+    return compiled_re.fullmatch(designation) is not None
 
 
 def is_packed_or_unpacked(designation: str,
-                          packed_compiled_re: re,
-                          unpacked_compiled_re: re) -> bool:
+                          packed_compiled_re: re.Pattern,
+                          unpacked_compiled_re: re.Pattern) -> bool:
     """
     Check if an input designation is a valid one according to the input 
     compiled regular expressions (they should match the type of designation you
     are trying to verify, e.g. re_number_designation and re_packed_number_designation for number designations).
     See also is_valid_number_designation() or is_valid_provisional_designation().
+    The module no longer uses it internally; it is kept as part of the public
+    API.
 
     *Input: designation is a string or an integer
     *Input: packed_compiled_re is a compiled regular expression conceived to find a
@@ -440,8 +645,9 @@ def is_packed_or_unpacked(designation: str,
     *Return: boolean
     """
 
-    return designation_matches_compiled_re(designation, packed_compiled_re) or designation_matches_compiled_re(
-        designation, unpacked_compiled_re)
+    designation = str(designation).strip()
+    return matches_once(designation, packed_compiled_re) or \
+        matches_once(designation, unpacked_compiled_re)
 
 
 def is_single_unpacked_provisional(designation: str) -> bool:
@@ -463,18 +669,68 @@ def is_single_unpacked_provisional(designation: str) -> bool:
     """
 
     designation = str(designation).strip()
+
+    # The most common case, e.g. "2008 EV5" or "2008-EV5", takes one match:
+    # re_number_designation then finds the year, which is followed by a word
+    # boundary. Note that "2008EV5" or "2008_EV5" are not valid number
+    # designations (no word boundary after the year), so they are False.
+    found = re_single_provisional_designation.match(designation)
+    if found and found[2] in (" ", "-"):
+        return True
+
     if is_valid_provisional_designation(designation) and is_valid_number_designation(designation):
+        return year_is_number(designation)
 
-        found = re_provisional_designation.findall(designation)
-        year = found[0][0]
+    return False
 
-        found = re_number_designation.findall(designation)
-        matched_number = found[0]
 
-        if matched_number == year:
-            return True
+def year_is_number(designation: str) -> bool:
+    """
+    Check whether the year of the unpacked provisional designation found in
+    the input is the number found by re_number_designation, e.g. True for
+    "2008 EV5" but False for "(341843) 2008 EV5". The input is assumed to be
+    a valid provisional and a valid number designation (see
+    is_single_unpacked_provisional()).
 
-    return False
+    *Input: an asteroid designation (string)
+
+    *Return: boolean
+    """
+
+    found = re_provisional_designation.search(designation)
+    if found is None:
+        # the provisional designation is a packed one
+        return False
+    year = found[1]
+
+    found = re_number_designation.search(designation)
+    if found is None:
+        # the number designation is a packed one
+        return False
+
+    return found[1] == year
+
+
+def probe(designation: str) -> Probe:
+    """
+    Run the survey, number and provisional validators once on the input
+    designation, as well as the check of is_single_unpacked_provisional().
+
+    *Input: an asteroid designation (string)
+
+    *Return: Probe
+    """
+
+    designation = str(designation).strip()
+
+    number = is_valid_number_designation(designation)
+    provisional = is_valid_provisional_designation(designation)
+    single_unpacked_provisional = number and provisional and year_is_number(designation)
+
+    return Probe(survey=is_valid_survey_designation(designation),
+                 number=number,
+                 provisional=provisional,
+                 single_unpacked_provisional=single_unpacked_provisional)
 
 
 def pack_base_62(designation: Union[str, int]) -> str:
@@ -492,15 +748,15 @@ def pack_base_62(designation: Union[str, int]) -> str:
     except ValueError:
         return f"pack_base_62(): Error. {designation} is not a valid number designation"
 
-    result = "~"  # the packed format always starts with ~
-    for i in range(4):
-        quotient = number // 62
-        remainder = number % 62
-        if remainder > 9:
-            remainder = f"{encode_cyphers(str(remainder))}"
-        number = quotient
-        result = str(remainder) + result
-    return result
+    # The four base 62 digits, from the last to the first one
+    number, fourth = divmod(number, 62)
+    number, third = divmod(number, 62)
+    number, second = divmod(number, 62)
+    first = number % 62
+
+    # the packed format always starts with ~
+    return "~" + base_62_digits[first] + base_62_digits[second] + \
+        base_62_digits[third] + base_62_digits[fourth]
 
 
 def unpack_base_62(designation: str) -> str:
@@ -514,19 +770,17 @@ def unpack_base_62(designation: str) -> str:
     message
     """
 
-    if not (designation_matches_compiled_re(designation, re_packed_long)):
+    found = search_once(str(designation).strip(), re_packed_long)
+    if found is None:
         error_message = f"{designation} is not a valid packed long number designation"
         return f"unpack_base_62(): Error. {error_message}"
 
-    total = 620000  # ~0000 corresponds to 620000
-    characters = designation.strip()[1:]  # removed the ~
-    for position, character in enumerate(characters[::-1]):
-        if character.isdigit():
-            integer_value = int(character)
-        else:
-            integer_value = int(decode_letter(character))
-        total += integer_value * np.power(62, position)
-    return str(total)
+    total = 0
+    characters = found.group(2)  # without the ~
+    for character in characters:
+        # Horner's method: no powers of 62 needed
+        total = total * 62 + base_62_values[character]
+    return str(total + 620000)  # ~0000 corresponds to 620000
 
 
 def pack_number_designation(designation: Union[str, int]) -> str:
@@ -545,18 +799,8 @@ def pack_number_designation(designation: Union[str, int]) -> str:
     if is_valid_number_designation(designation):
         try:
             # We remove parentheses and ignore
-            number = int(re.sub(r"[()]", "", designation.split(" ")[0]))
-            if number > 619999:
-                # We pack it with the base 62 notation
-                return pack_base_62(number)
-            elif number > 99999:
-                # regex for the two groups to pack the first two digits:
-                found = re6digits.findall(designation)
-                packed_part = encode_cyphers(found[0][0])
-                return packed_part + found[0][1]
-            else:
-                # it requires padding
-                return "{0:05d}".format(number)
+            number = int(designation.split(" ", 1)[0].translate(delete_parentheses))
+            return pack_number_value(number)
 
         except ValueError:
             # the int() failed, so it is already a valid packed designation
@@ -565,6 +809,27 @@ def pack_number_designation(designation: Union[str, int]) -> str:
         return error_message
 
 
+def pack_number_value(number: int) -> str:
+    """
+    Pack an asteroid number, e.g. 1 -> 00001, 123456 -> C3456 or
+    620000 -> ~0000. See pack_number_designation().
+
+    *Input: asteroid number (int)
+
+    *Return: string with the packed number designation
+    """
+
+    if number > 619999:
+        # We pack it with the base 62 notation
+        return pack_base_62(number)
+    elif number > 99999:
+        # We pack the digits before the last four ones
+        return encode_cyphers(number // 10000) + f"{number % 10000:04d}"
+    else:
+        # it requires padding
+        return f"{number:05d}"
+
+
 def unpack_num(designation: Union[str, int]) -> str:
     """
     Return the unpacked version of the input number designation if it is
@@ -580,17 +845,18 @@ def unpack_num(designation: Union[str, int]) -> str:
 
     designation = str(designation).strip()
     if is_valid_number_designation(designation):
-        found = re_packed_long.findall(designation)
-        if found and len(found) == 1:
+        if matches_once(designation, re_packed_long):
             return unpack_base_62(designation)
         else:
-            found = re_packed_number_designation.findall(designation)
-            if found and len(found) == 1:
-                first = decode_letter(found[0][0])
-                return first + found[0][1]
+            found = search_once(designation, re_packed_number_designation)
+            if found:
+                first = decode_letter(found[1])
+                return first + found[2]
             else:
-                found = re_number_designation.findall(designation)
-                return "{0:d}".format(int(found[0]))
+                found = re_number_designation.match(designation)
+                if found is None:
+                    return error_message
+                return str(int(found[1]))
     else:
         return error_message
 
@@ -619,34 +885,15 @@ def pack_provisional_designation(designation: Union[str, int]) -> str:
     designation = str(designation).strip()
     if is_valid_provisional_designation(designation):
 
-        found = re_provisional_designation.findall(designation)
-        if found and len(found) == 1:
-            # found has the form:
-            # [('1923', '-', 'AG', '342')]
-            #
-            # for year 1923 -> first=19, second=23
-            first = encode_year[found[0][0][0:2]]
-            second = found[0][0][2:]
-
-            # half-month period characters, e.g. A and B in 2010 AB3
-            first_hm = found[0][2][0]
-            second_hm = found[0][2][1]
-
-            number_part = found[0][3]
-            if len(number_part) == 0:
-                middle_part = "00"
-            elif len(number_part) > 2:
-                # We pack the two first numbers
-                middle_part = encode_cyphers(number_part[0:2]) + number_part[2]
-            else:
-                middle_part = "{0:02d}".format(int(number_part))
-
-            return first + second + first_hm + middle_part + second_hm
+        found = search_once(designation, re_provisional_designation)
+        if found:
+            # found has the groups:
+            # ('1923', '-', 'AG', '342')
+            return pack_provisional_fields(found[1], found[3], found[4])
 
         else:
             # It must be already packed:
-            found = re_packed_provisional_designation.findall(designation)
-            if found and len(found) == 1:
+            if matches_once(designation, re_packed_provisional_designation):
                 return designation
             else:
                 return error_message
@@ -654,6 +901,42 @@ def pack_provisional_designation(designation: Union[str, int]) -> str:
         return error_message
 
 
+def pack_provisional_fields(year: str, half_month: str, number_part: str) -> str:
+    """
+    Pack the fields of an unpacked provisional designation, e.g. "2010", "AB"
+    and "3" (2010 AB3) -> K10A03B. See pack_provisional_designation().
+
+    *Input: year (4 digits), half-month letters (2 letters) and the number part
+    (any number of digits, possibly none)
+
+    *Return: string with the packed provisional designation or an error message
+    """
+
+    # for year 1923 -> J23
+    packed_year = encode_full_year.get(year)
+    if packed_year is None:
+        # e.g. 1736, or a year with non-ASCII digits
+        return f"pack_provisional_fields(): Error. year '{year}' is not valid for packing"
+
+    # half-month period characters, e.g. A and B in 2010 AB3
+    first_hm = half_month[0]
+    second_hm = half_month[1]
+
+    # the usual cycle counts ("", "1", ..., "619") are in pack_cycle_count
+    middle_part = pack_cycle_count.get(number_part)
+    if middle_part is None:
+        # e.g. leading zeros ("05") or cycle counts over 619
+        if len(number_part) > 2:
+            # We pack the two first numbers
+            middle_part = encode_cyphers(number_part[0:2]) + number_part[2]
+        else:
+            # one or two digits, e.g. "05"; int() also turns non-ASCII
+            # digits into ASCII ones
+            middle_part = f"{int(number_part):02d}"
+
+    return packed_year + first_hm + middle_part + second_hm
+
+
 def unpack_provisional(designation: Union[str, int], separator: str) -> str:
     """Return the unpacked version of the input provisional designation if 
     it is a valid packed one, or the very input if it is a valid unpacked one.
@@ -667,35 +950,31 @@ def unpack_provisional(designation: Union[str, int], separator: str) -> str:
 
     error_message = f"unpack_provisional(): Error. '{designation}' not valid for unpacking"
 
-    designation = re.sub("[ _]", "-", str(designation).strip(), count=1)
+    designation = replace_first_separator(str(designation).strip())
     if is_valid_provisional_designation(designation):
-        found = re_provisional_designation.findall(designation)
-        if found and len(found) == 1:
+        found = search_once(designation, re_provisional_designation)
+        if found:
             # it is a valid provisional designation, already unpacked, so
             # we just insert the input separator
-            return found[0][0] + separator + found[0][2] + found[0][3]
-
-        found = re_packed_provisional_designation.findall(designation)
-        year_part_1 = decode_year[found[0][0]]
-        year_part_2 = found[0][1]
-        fortnight_1 = found[0][2]
-        fortnight_2 = found[0][5]
-        try:
-            digit_1 = int(found[0][3])
-            if digit_1 < 1:
-                digit_1 = ""
-            else:
-                digit_1 = str(digit_1)
-        except ValueError:
-            # It is a packed number, e.g. A0 instead of 100,
-            # so we unpack it
-            digit_1 = decode_letter(found[0][3][0])
-
-        digit_2 = found[0][4]
-        if int(found[0][4]) < 1:
-            digit_2 = ""
-
-        return year_part_1 + year_part_2 + separator + fortnight_1 + fortnight_2 + digit_1 + digit_2
+            return found[1] + separator + found[3] + found[4]
+
+        found = re_packed_provisional_designation.search(designation)
+        if found is None:
+            return error_message
+        year_part_1 = decode_year[found[1]]
+        year_part_2 = found[2]
+        fortnight_1 = found[3]
+        fortnight_2 = found[6]
+        # e.g. "05" -> "5", "A0" -> "100" or "00" -> ""
+        cycle_count = unpack_cycle_count.get(found[4] + found[5])
+        if cycle_count is None:
+            # the units digit is not an ASCII one (\d matches any decimal
+            # digit), e.g. "6\u0663": unpack the tens and keep the units as is
+            tens = unpack_cycle_count[found[4] + "0"][:-1]
+            units = "" if not tens and int(found[5]) == 0 else found[5]
+            cycle_count = tens + units
+
+        return year_part_1 + year_part_2 + separator + fortnight_1 + fortnight_2 + cycle_count
     else:
         return error_message
 
@@ -755,7 +1034,7 @@ def unpack(designation: Union[str, int], separator: str) -> str:
     """
     Call the necessary function for unpacking the input after some checks. 
     If the input designation is already a valid unpacked designation, it 
-    returns it. 
+    returns it. The results are cached, see unpack_string().
 
     *Input: an asteroid designation (string or int)
     *Input: character to be used to separate provisional designations
@@ -763,54 +1042,212 @@ def unpack(designation: Union[str, int], separator: str) -> str:
     *Return: an unpacked asteroid designation (string) or an error message
     """
 
-    error_message = f"unpack(): Error. '{designation}' not valid for unpacking"
+    unpacked = unpack_string(str(designation).strip(), str(separator))
+    if unpacked is None:
+        return f"unpack(): Error. '{designation}' not valid for unpacking"
+    return unpacked
 
-    designation = str(designation).strip()
 
-    single_provis = is_single_unpacked_provisional(designation)
+@lru_cache(maxsize=65536)
+def unpack_string(designation: str, separator: str) -> Optional[str]:
+    """
+    Does the work of unpack() for an already stripped string. The results are
+    kept in a bounded cache (the last 65536 inputs), so a designation that
+    appears several times in a list is only unpacked once.
 
-    if is_valid_survey_designation(designation):
-        if is_unpacked_survey_designation(designation):
+    *Input: an asteroid designation (stripped string)
+    *Input: character to be used to separate provisional designations
+
+    *Return: an unpacked asteroid designation (string), an error message from
+    the unpacking functions or None if the input is not a valid designation
+    """
+
+    found = re_any_designation.fullmatch(designation)
+    if found:
+        # The input is just one designation of the kind found, so we unpack it
+        # without validating it again
+        kind = found.lastgroup
+        if kind == "survey":
             return designation
+        elif kind == "packed_survey":
+            # e.g. PLS2040 -> 2040 P-L
+            return designation[3:] + " " + designation[0] + "-" + designation[1]
+        elif kind == "packed_long":
+            return unpack_base_62(designation)
+        elif kind == "packed_number":
+            return decode_letter(designation[0]) + designation[1:]
+        elif kind == "number":
+            return str(int(designation.translate(delete_parentheses)))
+        elif kind == "provisional":
+            fields = re_single_provisional_designation.match(designation)
+            if fields:
+                # we only insert the separator
+                return fields[1] + separator + fields[3] + fields[4]
         else:
-            return unpack_survey_designation(designation)
-    elif is_valid_number_designation(designation) and not single_provis:
-        return unpack_num(designation)
-    elif is_valid_provisional_designation(designation):
-        return unpack_provisional(designation, str(separator))
+            # e.g. K08E10V -> K (20) + 08 + E + V + 10 -> 2008 EV10
+            return decode_year[designation[0]] + designation[1:3] + separator + \
+                designation[3] + designation[6] + unpack_cycle_count[designation[4:6]]
+
+    kind = classify_string(designation)
 
+    if kind == "survey":
+        return designation
+    elif kind == "packed_survey":
+        return unpack_survey_designation(designation)
+    elif kind in number_kinds:
+        return unpack_num(designation)
+    elif kind in provisional_kinds:
+        return unpack_provisional(designation, separator)
     else:
-        return error_message
+        return None
 
 
 def pack(designation: Union[str, int]) -> str:
     """
     Call the necessary function for packing the input designation after some 
     checks. If the input designation is already a valid packed designation, it 
-    returns it. 
+    returns it. The results are cached, see pack_string().
 
     *Input: an asteroid designation (string or int)
 
     *Return: an unpacked asteroid designation (string) or error message
     """
 
-    error_message = f"pack(): Error. '{designation}' not valid for packing"
+    packed = pack_string(str(designation).strip())
+    if packed is None:
+        return f"pack(): Error. '{designation}' not valid for packing"
+    return packed
 
-    designation = str(designation).strip()
 
-    single_provis = is_single_unpacked_provisional(designation)
+@lru_cache(maxsize=65536)
+def pack_string(designation: str) -> Optional[str]:
+    """
+    Does the work of pack() for an already stripped string. The results are
+    kept in a bounded cache (the last 65536 inputs), so a designation that
+    appears several times in a list is only packed once.
+
+    *Input: an asteroid designation (stripped string)
+
+    *Return: a packed asteroid designation (string), an error message from
+    the packing functions or None if the input is not a valid designation
+    """
 
-    if is_valid_survey_designation(designation):
+    found = re_any_designation.fullmatch(designation)
+    if found:
+        # The input is just one designation of the kind found, so we pack it
+        # without validating it again
+        kind = found.lastgroup
+        if kind == "survey":
+            # e.g. 2040 P-L -> PLS2040
+            return designation[5] + designation[7] + "S" + designation[:4]
+        elif kind == "number":
+            return pack_number_value(int(designation.translate(delete_parentheses)))
+        elif kind == "provisional":
+            fields = re_single_provisional_designation.match(designation)
+            if fields:
+                return pack_provisional_fields(fields[1], fields[3], fields[4])
+        else:
+            # it is already packed (packed_survey, packed_number, ...), so it
+            # stays as it is
+            return designation
+
+    kind = classify_string(designation)
+
+    if kind in survey_kinds:
         return pack_survey_designation(designation)
-    elif is_valid_number_designation(designation) and not single_provis:
+    elif kind in number_kinds:
         return pack_number_designation(designation)
-    elif is_valid_provisional_designation(designation):
+    elif kind in provisional_kinds:
         return pack_provisional_designation(designation)
     else:
-        return error_message
+        return None
+
+
+def read_designations(filename: str) -> List[str]:
+    """
+    Read a file with asteroid designations arranged in a single column. The
+    whole file is read at once through a large buffer, instead of line by line,
+    and split into lines afterwards.
+
+    *Input: name of the file
+
+    *Return: list with the lines of the file, without newline characters
+    """
+
+    with open(filename, 'r', buffering=1 << 20) as openfile:
+        lines = openfile.read().split("\n")
+
+    if lines[-1] == "":
+        # Nothing after the last newline character (or an empty file)
+        lines.pop()
+
+    return lines
+
+
+def print_lines(lines: List[str]) -> None:
+    """
+    Print the input strings one per line with a single write to stdout, rather
+    than calling print() for each of them.
+
+    *Input: list of strings
+    """
 
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
-def convert(designation: Union[str, int], mode: Enum) -> str:
+
+def convert_batch(designations: List[str], mode: Enum, separator: str = " ",
+                  empty_line: str = "") -> List[str]:
+    """
+    Pack or unpack a whole list of designations (e.g. the lines of a file) in
+    one call. The conversion function is chosen once for the whole list and
+    the list is built with a single comprehension, instead of testing the mode
+    and appending the result for every designation.
+
+    The mode is not checked here: main() only builds valid modes and convert()
+    checks it before calling this function.
+
+    *Input: list of asteroid designations
+    *Input: mode (Mode.PACK or Mode.UNPACK)
+    *Input: separator for the unpacked provisional designations
+    *Input: string to output for the empty (or blank) lines
+
+    *Return: list with the packed or unpacked designations, in the same order
+    """
+
+    if mode == Mode.PACK:
+        return [pack(designation.rstrip("\n"))
+                if designation.strip() else empty_line
+                for designation in designations]
+    else:
+        return [unpack(designation.rstrip("\n"), separator)
+                if designation.strip() else empty_line
+                for designation in designations]
+
+
+def convert_file(openfile: TextIO, mode: Enum, separator: str,
+                 empty_line: str) -> None:
+    """
+    Pack or unpack the designations of an open file, one per line, and print
+    the results. The file is read, converted and printed in chunks of about
+    64 KiB, so that big files are never held in memory as a whole and stdout
+    is written once per chunk. See convert_batch().
+
+    *Input: file object opened for reading
+    *Input: mode (Mode.PACK or Mode.UNPACK)
+    *Input: separator for the unpacked provisional designations
+    *Input: string to output for the empty (or blank) lines
+
+    *Return: None, the output is printed
+    """
+
+    for lines in iter(lambda: openfile.readlines(1 << 16), []):
+        # convert_batch() removes the newline characters
+        print_lines(convert_batch(lines, mode, separator, empty_line))
+
+
+def convert(designation: Union[str, int], mode: Enum) -> None:
     """
     Pack or unpack the input designation or file with designations. This is
     simply the main() function but without using the argument parser and a
@@ -822,7 +1259,7 @@ def convert(designation: Union[str, int], mode: Enum) -> str:
     *Input: asteroid designation or a file with asteroid designations
     *Input: mode (Mode.PACK or Mode.UNPACK)
 
-    *Return: string with output or an error message
+    *Return: None, the output is printed
     """
 
     designation = str(designation)
@@ -832,62 +1269,54 @@ def convert(designation: Union[str, int], mode: Enum) -> str:
     else:
         try:
             # Perhaps it is an input filename, not a designation
-            my_file = open(designation, 'r')
-            designations = my_file.readlines()
-            my_file.close()
+            designations = read_designations(designation)
         except IOError:
-            print("convert(): Error. Did not find file '{0}'".format(designation))
+            print(f"convert(): Error. Did not find file '{designation}'")
             designations = []
             # We still need an empty list to iterate over
 
-    for designation in designations:
-        if len(designation.split()) < 1:
-            print("convert(): Warning. Input is an empty line")
-        elif mode == Mode.UNPACK:
-            print(unpack(designation.replace("\n", ""), "_"))
-        elif mode == Mode.PACK:
-            print(pack(designation.replace("\n", "")))
-        else:
-            print("convert(): Error. 2nd arg. must be 'pack' or 'unpack'")
+    if mode in (Mode.PACK, Mode.UNPACK):
+        output = convert_batch(designations, mode, "_",
+                               "convert(): Warning. Input is an empty line")
+    else:
+        output = ["convert(): Warning. Input is an empty line"
+                  if not designation.strip() else
+                  "convert(): Error. 2nd arg. must be 'pack' or 'unpack'"
+                  for designation in designations]
+
+    print_lines(output)
 
 
-def main():
+def main() -> None:
     parsed = argParserMPC.parse_args()
 
     if not (parsed.pack or parsed.unpack):
         print("main(): Error. Either -p or -u must be used")
         sys.exit(-1)
 
+    mode = Mode.PACK if parsed.pack else Mode.UNPACK
+    empty_line = "main(): Warning. Empty line"
+
     if parsed.designation:
         # if we parsed a designation, we have a list with one element
-        designations = [parsed.designation]
+        print_lines(convert_batch([parsed.designation], mode, parsed.separator,
+                                  empty_line))
 
     elif parsed.filename:
         filename = str(parsed.filename)
         # we expect a file with many designations
         try:
-            openfile = open(filename, 'r')
-            designations = openfile.readlines()
-            openfile.close()
+            openfile = open(filename, 'r', buffering=1 << 20)
         except IOError:
-            print("main(): Error. Did not find file '{0}'\n".format(filename))
+            print(f"main(): Error. Did not find file '{filename}'\n")
             sys.exit(-2)
+
+        with openfile:
+            convert_file(openfile, mode, parsed.separator, empty_line)
     else:
         print("main(): Error. Input a designation [-d] or a file name [-f]")
         sys.exit(-3)
 
-    #
-    # If we made it here, we have at least one designation to try to convert
-    #
-    for designation in designations:
-        if len(designation.split()) < 1:
-            print("main(): Warning. Empty line")
-        else:
-            if parsed.pack:
-                print(pack(designation.replace("\n", "")))
-            elif parsed.unpack:
-                print(unpack(designation.replace("\n", ""), parsed.separator))
-
 
 if __name__ == "__main__":
     # execute only if run as a script